@@ -1,10 +1,13 @@
 import asyncio
 import logging
 import os
-from fastapi import FastAPI, HTTPException
+import time
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 from dotenv import load_dotenv
-import openai
-import redis
+import orjson
+from openai import AsyncOpenAI
+import redis.asyncio as aioredis
 # Remove livekit api import for now - will add when needed for room management
 
 # Load environment variables
@@ -15,39 +18,153 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
-app = FastAPI(title="LiveKit AI Agent", version="1.0.0")
+app = FastAPI(title="LiveKit AI Agent", version="1.0.0", default_response_class=ORJSONResponse)
 
-# OpenAI configuration - client will be initialized per request
-
-# Initialize Redis client
-redis_client = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379"))
+# OpenAI and Redis clients are created once at startup (see below) and shared via app.state
 
 # LiveKit configuration
 LIVEKIT_URL = os.getenv("LIVEKIT_URL", "ws://livekit:7880")
 LIVEKIT_API_KEY = os.getenv("LIVEKIT_API_KEY", "devkey")
 LIVEKIT_API_SECRET = os.getenv("LIVEKIT_API_SECRET", "secret")
 
+# Health probes within this many seconds reuse the previous result instead of pinging Redis
+HEALTH_CACHE_TTL = 1.0
+
+# /test/openai batching: requests already queued are dispatched together, up to this many
+OPENAI_MAX_BATCH = 16
+
+async def openai_completion(user_message: str) -> str:
+    """Run a single test chat completion with the shared client"""
+    response = await app.state.openai.chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[
+            {"role": "system", "content": "You are a helpful AI assistant for phone calls."},
+            {"role": "user", "content": user_message}
+        ],
+        max_tokens=150,
+        temperature=0.7
+    )
+    return response.choices[0].message.content
+
+def fail_openai_requests(batch: list, error: Exception):
+    """Fail every still-pending future in a batch of queued requests"""
+    for future, _ in batch:
+        if not future.done():
+            future.set_exception(error)
+
+async def dispatch_openai_batch(batch: list):
+    """Send a batch of queued requests concurrently and resolve their futures"""
+    try:
+        results = await asyncio.gather(
+            *(openai_completion(user_message) for _, user_message in batch),
+            return_exceptions=True
+        )
+    except asyncio.CancelledError:
+        fail_openai_requests(batch, RuntimeError("Server is shutting down"))
+        raise
+    for (future, _), result in zip(batch, results):
+        if future.done():  # caller disconnected
+            continue
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+async def openai_batch_worker(queue: asyncio.Queue, tasks: set):
+    """Collect queued /test/openai requests into small batches"""
+    while True:
+        # Take whatever is already waiting and dispatch at once; no timed window,
+        # since the upstream calls are concurrent anyway and waiting only adds latency
+        batch = [await queue.get()]
+        while len(batch) < OPENAI_MAX_BATCH and not queue.empty():
+            batch.append(queue.get_nowait())
+        # Dispatch in the background so the next batch can form meanwhile;
+        # keep a reference so the task can't be garbage-collected mid-flight
+        task = asyncio.create_task(dispatch_openai_batch(batch))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+@app.on_event("startup")
+async def startup():
+    """Create the shared Redis and OpenAI clients"""
+    app.state.redis_pool = aioredis.ConnectionPool.from_url(
+        os.getenv("REDIS_URL", "redis://redis:6379"),
+        max_connections=20,
+        socket_timeout=2,
+        socket_connect_timeout=1,
+        health_check_interval=30
+    )
+    # Single client for the whole process - never build a Redis() per request
+    app.state.redis = aioredis.Redis(connection_pool=app.state.redis_pool)
+    app.state.health_cache = (0.0, None)  # (monotonic timestamp, response)
+    try:
+        # Pre-warm: open the first pooled connection now rather than on the first request
+        await app.state.redis.ping()
+    except Exception as e:
+        logger.warning(f"Redis not reachable at startup: {e}")
+    
+    # Reuse one OpenAI client so its HTTP connection pool survives across requests
+    # (the SDK refuses to build a client without a key, so leave it unset in that case)
+    api_key = os.getenv("OPENAI_API_KEY")
+    app.state.openai = AsyncOpenAI(api_key=api_key) if api_key else None
+    
+    app.state.openai_queue = asyncio.Queue()
+    app.state.openai_batches = set()  # in-flight dispatch tasks
+    app.state.openai_worker = asyncio.create_task(
+        openai_batch_worker(app.state.openai_queue, app.state.openai_batches)
+    )
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release Redis and OpenAI connections"""
+    # Stop batching, then fail anything in flight or still queued so callers don't hang
+    app.state.openai_worker.cancel()
+    for task in app.state.openai_batches:
+        task.cancel()
+    await asyncio.gather(app.state.openai_worker, *app.state.openai_batches, return_exceptions=True)
+    queue = app.state.openai_queue
+    while not queue.empty():
+        fail_openai_requests([queue.get_nowait()], RuntimeError("Server is shutting down"))
+    
+    await app.state.redis_pool.disconnect()
+    if app.state.openai is not None:
+        await app.state.openai.close()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    checked_at, cached = app.state.health_cache
+    if cached is not None and time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+        return cached
+    
     try:
         # Test Redis connection
-        redis_client.ping()
+        await app.state.redis.ping()
         redis_status = "connected"
     except Exception as e:
         logger.error(f"Redis connection failed: {e}")
         redis_status = "disconnected"
     
-    return {
+    result = {
         "status": "healthy",
         "service": "ai-agent",
         "redis": redis_status,
         "openai_configured": bool(os.getenv("OPENAI_API_KEY"))
     }
+    app.state.health_cache = (time.monotonic(), result)
+    return result
 
 @app.post("/webhook/livekit")
-async def livekit_webhook(webhook_data: dict):
+async def livekit_webhook(request: Request):
     """Handle LiveKit webhook events"""
+    # Parse the raw body directly; a dict parameter goes through FastAPI's generic validation
+    try:
+        webhook_data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(webhook_data, dict):
+        raise HTTPException(status_code=400, detail="Webhook body must be a JSON object")
+    
     logger.info(f"Received LiveKit webhook: {webhook_data}")
     
     event_type = webhook_data.get("event")
@@ -66,25 +183,15 @@ async def livekit_webhook(webhook_data: dict):
 async def test_openai(message: dict):
     """Test OpenAI integration"""
     try:
-        from openai import OpenAI
-        
         user_message = message.get("message", "Hello, how are you?")
         
-        # Initialize OpenAI client with the new API
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        
-        # Test OpenAI API call with new syntax
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are a helpful AI assistant for phone calls."},
-                {"role": "user", "content": user_message}
-            ],
-            max_tokens=150,
-            temperature=0.7
-        )
+        if app.state.openai is None:
+            raise RuntimeError("OPENAI_API_KEY is not configured")
         
-        ai_response = response.choices[0].message.content
+        # Queue the request for the batch worker and wait for its result
+        future = asyncio.get_running_loop().create_future()
+        await app.state.openai_queue.put((future, user_message))
+        ai_response = await future
         
         return {
             "status": "success",
@@ -99,16 +206,30 @@ async def test_openai(message: dict):
             "error": str(e)
         }
 
+# Static root payload, serialized once
+ROOT_PAYLOAD = orjson.dumps({
+    "message": "LiveKit AI Agent is running",
+    "health_endpoint": "/health",
+    "webhook_endpoint": "/webhook/livekit",
+    "test_endpoint": "/test/openai"
+})
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "LiveKit AI Agent is running",
-        "health_endpoint": "/health",
-        "webhook_endpoint": "/webhook/livekit",
-        "test_endpoint": "/test/openai"
-    }
+    return Response(content=ROOT_PAYLOAD, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
+    # Multiple workers need the app as an import string rather than an instance.
+    # UVICORN_UDS binds a Unix socket instead of TCP for same-host/shared-volume callers.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8080,
+        uds=os.getenv("UVICORN_UDS"),
+        workers=int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+        loop="uvloop",
+        http="httptools",
+        access_log=False
+    )
\ No newline at end of file
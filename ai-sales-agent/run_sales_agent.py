@@ -4,28 +4,36 @@ AI Sales Agent Startup Script
 Initializes the system and starts the web interface
 """
 
+import atexit
 import os
 import sys
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from customer_manager import CustomerManager, generate_sample_customers
-from web_interface import app
+from customer_manager import CustomerManager, sample_customer_rows
 import uvicorn
 
 def setup_logging():
     """Configure logging"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('logs/sales_agent.log'),
-            logging.StreamHandler()
-        ]
-    )
+    # Callers (including the event loop) only enqueue records; a listener
+    # thread does the file and stderr writes
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler('logs/sales_agent.log'), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))  # no formatter: the listener's handlers format
+    listener.start()
+    atexit.register(listener.stop)
 
 def setup_directories():
     """Create necessary directories"""
@@ -50,10 +58,8 @@ def initialize_database():
             print(f"✅ Imported {imported} customers from CSV")
         else:
             # Generate sample customers programmatically
-            sample_customers = generate_sample_customers()
-            for customer in sample_customers:
-                customer_manager.add_customer(customer)
-            print(f"✅ Added {len(sample_customers)} sample customers")
+            added = customer_manager.bulk_insert(sample_customer_rows())
+            print(f"✅ Added {added} sample customers")
     else:
         print(f"📋 Database already has {stats['total_customers']} customers")
     
@@ -103,12 +109,19 @@ def main():
     
     # Start the web server
     try:
+        # Campaign state lives in the web process, so default to a single worker;
+        # WEB_CONCURRENCY can raise it once that state is shared externally.
+        # UVICORN_UDS binds a Unix socket instead of TCP for same-host callers.
         uvicorn.run(
-            app, 
+            "web_interface:app",
             host="0.0.0.0", 
             port=8000,
+            uds=os.getenv("UVICORN_UDS"),
+            workers=int(os.getenv("WEB_CONCURRENCY", 1)),
+            loop="uvloop",
+            http="httptools",
             log_level="info",
-            access_log=True
+            access_log=False
         )
     except KeyboardInterrupt:
         print(f"\n👋 AI Sales Agent System stopped")
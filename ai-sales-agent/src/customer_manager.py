@@ -3,17 +3,37 @@ Customer Database Manager for Receipt Roll Sales
 Handles customer data, call history, and lead management
 """
 
+import asyncio
 import json
 import csv
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Iterator, List, Dict, Optional, Tuple
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime
+from types import MappingProxyType
 import sqlite3
+import threading
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Calling priority per status (lower is called first); anything else sorts last.
+# Read-only because the ORDER BY clause below is generated from it once at import.
+STATUS_PRIORITY = MappingProxyType({
+    "new": 1,
+    "interested": 2,
+    "callback_requested": 3,
+    "contacted": 4
+})
+
+_PRIORITY_ORDER_SQL = "CASE status {} ELSE 99 END".format(
+    " ".join(f"WHEN '{status}' THEN {rank}" for status, rank in STATUS_PRIORITY.items())
+)
+
+@dataclass(slots=True)
 class Customer:
     """Customer data structure"""
     name: str
@@ -32,38 +52,216 @@ class Customer:
     created_at: str = ""
     updated_at: str = ""
 
+# customers table columns, in Customer field order so rows map positionally
+CUSTOMER_COLUMNS = tuple(field.name for field in fields(Customer))
+_CUSTOMER_COLUMNS_SQL = ", ".join(CUSTOMER_COLUMNS)
+_CUSTOMER_PLACEHOLDERS_SQL = ", ".join("?" * len(CUSTOMER_COLUMNS))
+_INSERT_CUSTOMER_SQL = f"INSERT INTO customers ({_CUSTOMER_COLUMNS_SQL}) VALUES ({_CUSTOMER_PLACEHOLDERS_SQL})"
+# Bulk variant: rows whose phone already exists are skipped instead of raising
+_INSERT_OR_IGNORE_CUSTOMER_SQL = _INSERT_CUSTOMER_SQL.replace("INSERT", "INSERT OR IGNORE", 1)
+# Customer -> parameter tuple in CUSTOMER_COLUMNS order
+_customer_values = attrgetter(*CUSTOMER_COLUMNS)
+
+# Read queries as fixed strings, so each is compiled once per connection and
+# then served from the sqlite3 statement cache
+_SELECT_CUSTOMERS_SQL = f"SELECT {_CUSTOMER_COLUMNS_SQL} FROM customers"
+_CUSTOMERS_BY_STATUS_SQL = f"{_SELECT_CUSTOMERS_SQL} WHERE status = ?"
+_CUSTOMERS_PAGE_SQL = f"{_SELECT_CUSTOMERS_SQL} WHERE status = ? AND phone > ? ORDER BY phone LIMIT ?"
+_CUSTOMERS_CHANGED_SQL = f"SELECT {_CUSTOMER_COLUMNS_SQL}, version FROM customers WHERE version > ? ORDER BY version"
+_LATEST_VERSION_SQL = "SELECT COALESCE(MAX(version), 0) FROM customers"
+_QUEUE_BY_STATUS_SQL = f"{_SELECT_CUSTOMERS_SQL} WHERE status = ? ORDER BY created_at, phone LIMIT ?"
+_PRIORITY_QUEUE_STATUSES = ("new", "interested", "callback_requested")
+_PRIORITY_QUEUE_SQL = (
+    f"{_SELECT_CUSTOMERS_SQL} WHERE status IN ({', '.join('?' * len(_PRIORITY_QUEUE_STATUSES))}) "
+    f"ORDER BY {_PRIORITY_ORDER_SQL}, created_at, phone LIMIT ?"
+)
+
+# Keyed by phone with no separate rowid: every lookup and update goes by phone,
+# and the table is stored as a single b-tree on that key
+_CUSTOMERS_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        name TEXT NOT NULL,
+        phone TEXT PRIMARY KEY NOT NULL,
+        business_name TEXT NOT NULL,
+        business_type TEXT,
+        email TEXT,
+        address TEXT,
+        last_contact TEXT,
+        status TEXT DEFAULT 'new',
+        notes TEXT,
+        estimated_monthly_usage INTEGER DEFAULT 0,
+        current_supplier TEXT,
+        pain_points TEXT,
+        best_contact_time TEXT,
+        created_at TEXT,
+        updated_at TEXT,
+        version INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID
+'''
+
+# Every insert or update of a customer gives the row the next change version,
+# so readers can ask for just the rows changed since the version they last saw
+_CUSTOMER_VERSION_TRIGGERS_SQL = (
+    '''
+    CREATE TRIGGER IF NOT EXISTS customers_version_insert AFTER INSERT ON customers
+    BEGIN
+        UPDATE customers SET version = (SELECT MAX(version) FROM customers) + 1
+        WHERE phone = NEW.phone;
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS customers_version_update
+    AFTER UPDATE OF {_CUSTOMER_COLUMNS_SQL} ON customers
+    BEGIN
+        UPDATE customers SET version = (SELECT MAX(version) FROM customers) + 1
+        WHERE phone = NEW.phone;
+    END
+    ''',
+)
+
+_UPDATE_STATUS_SQL = '''
+    UPDATE customers 
+    SET status = ?, notes = ?, last_contact = ?, updated_at = ?
+    WHERE phone = ?
+'''
+
+_INSERT_CALL_SQL = '''
+    INSERT INTO call_history (
+        customer_phone, call_date, duration_seconds, outcome,
+        notes, follow_up_needed, follow_up_date, agent_name, call_ts
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+@lru_cache(maxsize=16)
+def _customers_by_statuses_sql(count: int) -> str:
+    """SELECT for `count` statuses; results come back grouped in parameter order"""
+    placeholders = ", ".join("?" * count)
+    order = " ".join(f"WHEN ? THEN {i}" for i in range(count))
+    return (
+        f'SELECT {_CUSTOMER_COLUMNS_SQL} FROM customers WHERE status IN ({placeholders}) '
+        f'ORDER BY CASE status {order} END, phone'
+    )
+
 class CustomerManager:
     """Manages customer database operations"""
     
+    # Connection-level tuning applied once when the connection is opened
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-65536",
+    )
+    
     def __init__(self, db_path: str = "data/customers.db"):
         self.db_path = db_path
+        # One long-lived write connection so SQLite's page cache and the sqlite3
+        # statement cache survive between calls; the lock serializes writers
+        # because the web interface may call in from worker threads
+        self._conn = self._connect()
+        self._lock = threading.RLock()
+        # Reads use one connection per thread instead: under WAL they run
+        # alongside each other and alongside the writer
+        self._local = threading.local()
+        self._read_conns = []
+        # Threads for the *_async wrappers used from the event loop
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="customer-db")
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _reader(self) -> sqlite3.Connection:
+        """This thread's read connection, opened on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._lock:
+                self._read_conns.append(conn)
+        return conn
+    
+    def close(self):
+        """Close the underlying database connections"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for conn in self._read_conns:
+                conn.close()
+            self._conn.close()
+    
+    async def _run_async(self, method, *args, **kwargs):
+        """Run a blocking database method on the executor and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(method, *args, **kwargs))
+    
+    # Async variants for callers on the event loop; the sqlite work itself stays synchronous
+    async def add_customer_async(self, customer: Customer) -> bool:
+        return await self._run_async(self.add_customer, customer)
+    
+    async def get_customers_by_status_async(self, status: str) -> List[Customer]:
+        return await self._run_async(self.get_customers_by_status, status)
+    
+    async def get_customers_by_statuses_async(self, statuses: List[str]) -> List[Customer]:
+        return await self._run_async(self.get_customers_by_statuses, statuses)
+    
+    async def get_customers_changed_since_async(self, version: int) -> Tuple[int, List[Customer]]:
+        return await self._run_async(self.get_customers_changed_since, version)
+    
+    async def update_customer_status_async(self, phone: str, status: str, notes: str = "") -> bool:
+        return await self._run_async(self.update_customer_status, phone, status, notes)
+    
+    async def log_call_history_async(self, phone: str, outcome: str, *args, **kwargs) -> bool:
+        return await self._run_async(self.log_call_history, phone, outcome, *args, **kwargs)
+    
+    async def record_calls_async(self, calls: List[tuple]) -> int:
+        return await self._run_async(self.record_calls, calls)
+    
+    async def get_calling_queue_async(self, max_calls: int = 50, prioritize_by: str = "new") -> List[Customer]:
+        return await self._run_async(self.get_calling_queue, max_calls, prioritize_by)
+    
+    async def get_stats_async(self) -> Dict:
+        return await self._run_async(self.get_stats)
+    
     def init_database(self):
         """Initialize SQLite database with customers table"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            # Explicit transaction so the schema migrations below apply atomically
+            cursor.execute('BEGIN')
+            self._create_schema(cursor)
+        logger.info("Database initialized at %s", self.db_path)
+    
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables and indexes if they do not exist yet"""
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS customers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                phone TEXT UNIQUE NOT NULL,
-                business_name TEXT NOT NULL,
-                business_type TEXT,
-                email TEXT,
-                address TEXT,
-                last_contact TEXT,
-                status TEXT DEFAULT 'new',
-                notes TEXT,
-                estimated_monthly_usage INTEGER DEFAULT 0,
-                current_supplier TEXT,
-                pain_points TEXT,
-                best_contact_time TEXT,
-                created_at TEXT,
-                updated_at TEXT
+        # Databases created before customers was keyed by phone still have the
+        # rowid table: rebuild it as a WITHOUT ROWID copy, then swap it in
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'customers'")
+        existing = cursor.fetchone()
+        if existing and 'WITHOUT ROWID' not in existing[0].upper():
+            cursor.execute(_CUSTOMERS_TABLE_SQL.format(table='customers_new'))
+            cursor.execute(
+                f'INSERT INTO customers_new ({_CUSTOMER_COLUMNS_SQL}) '
+                f'SELECT {_CUSTOMER_COLUMNS_SQL} FROM customers ORDER BY id'
             )
-        ''')
+            cursor.execute('DROP TABLE customers')
+            cursor.execute('ALTER TABLE customers_new RENAME TO customers')
+            logger.info("Migrated customers table to WITHOUT ROWID")
+        
+        cursor.execute(_CUSTOMERS_TABLE_SQL.format(table='customers'))
+        
+        # Databases created before change versions: add the column; rows that
+        # predate it (or were just migrated) all start at version 1
+        cursor.execute('PRAGMA table_info(customers)')
+        if 'version' not in {column[1] for column in cursor.fetchall()}:
+            cursor.execute('ALTER TABLE customers ADD COLUMN version INTEGER NOT NULL DEFAULT 0')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_customers_version ON customers (version)')
+        cursor.execute('UPDATE customers SET version = 1 WHERE version = 0')
+        for trigger_sql in _CUSTOMER_VERSION_TRIGGERS_SQL:
+            cursor.execute(trigger_sql)
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS call_history (
@@ -76,96 +274,114 @@ class CustomerManager:
                 follow_up_needed BOOLEAN,
                 follow_up_date TEXT,
                 agent_name TEXT,
+                call_ts INTEGER,
                 FOREIGN KEY (customer_phone) REFERENCES customers (phone)
             )
         ''')
         
-        conn.commit()
-        conn.close()
-        logger.info(f"Database initialized at {self.db_path}")
+        # Databases created before call_ts existed: add it and backfill the
+        # unix epoch from the local-time ISO call_date
+        cursor.execute('PRAGMA table_info(call_history)')
+        if 'call_ts' not in {column[1] for column in cursor.fetchall()}:
+            cursor.execute('ALTER TABLE call_history ADD COLUMN call_ts INTEGER')
+            cursor.execute('''
+                UPDATE call_history
+                SET call_ts = CAST(strftime('%s', call_date, 'utc') AS INTEGER)
+            ''')
+        
+        # Indexes for the status filters, recent-call stats and per-phone history
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_customers_status ON customers (status)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_customers_status_created ON customers (status, created_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_call_history_date ON call_history (call_date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_call_history_ts ON call_history (call_ts)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_call_history_phone ON call_history (customer_phone)')
     
     def add_customer(self, customer: Customer) -> bool:
         """Add a new customer to the database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             now = datetime.now().isoformat()
             customer.created_at = now
             customer.updated_at = now
             
-            cursor.execute('''
-                INSERT INTO customers (
-                    name, phone, business_name, business_type, email, address,
-                    last_contact, status, notes, estimated_monthly_usage,
-                    current_supplier, pain_points, best_contact_time,
-                    created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                customer.name, customer.phone, customer.business_name,
-                customer.business_type, customer.email, customer.address,
-                customer.last_contact, customer.status, customer.notes,
-                customer.estimated_monthly_usage, customer.current_supplier,
-                customer.pain_points, customer.best_contact_time,
-                customer.created_at, customer.updated_at
-            ))
+            with self._lock, self._conn:
+                self._conn.execute(_INSERT_CUSTOMER_SQL, _customer_values(customer))
             
-            conn.commit()
-            conn.close()
-            logger.info(f"Added customer: {customer.name} ({customer.phone})")
+            logger.info("Added customer: %s (%s)", customer.name, customer.phone)
             return True
             
         except sqlite3.IntegrityError:
-            logger.warning(f"Customer with phone {customer.phone} already exists")
+            logger.warning("Customer with phone %s already exists", customer.phone)
             return False
         except Exception as e:
-            logger.error(f"Error adding customer: {e}")
+            logger.error("Error adding customer: %s", e)
             return False
     
     def get_customers_by_status(self, status: str) -> List[Customer]:
         """Get all customers with a specific status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._reader().execute(_CUSTOMERS_BY_STATUS_SQL, (status,))
+        rows = cursor.fetchall()
+        
+        return [self._row_to_customer(row) for row in rows]
+    
+    def get_customers_by_statuses(self, statuses: List[str]) -> List[Customer]:
+        """Get all customers with any of the given statuses in one query, grouped by status in that order"""
+        if not statuses:
+            return []
         
-        cursor.execute('SELECT * FROM customers WHERE status = ?', (status,))
+        cursor = self._reader().execute(_customers_by_statuses_sql(len(statuses)), (*statuses, *statuses))
         rows = cursor.fetchall()
-        conn.close()
         
-        customers = []
-        for row in rows:
-            customer = Customer(
-                name=row[1], phone=row[2], business_name=row[3],
-                business_type=row[4], email=row[5], address=row[6],
-                last_contact=row[7], status=row[8], notes=row[9],
-                estimated_monthly_usage=row[10], current_supplier=row[11],
-                pain_points=row[12], best_contact_time=row[13],
-                created_at=row[14], updated_at=row[15]
-            )
-            customers.append(customer)
+        return [self._row_to_customer(row) for row in rows]
+    
+    def iter_customers_by_statuses(self, statuses: List[str], page_size: int = 500) -> Iterator[Customer]:
+        """Yield customers with the given statuses, grouped by status in that order
+        
+        Rows are read in pages keyed on phone, so memory stays bounded and no
+        cursor stays open between pages (the consumer may resume on another thread).
+        """
+        for status in statuses:
+            last_phone = ""
+            while True:
+                rows = self._reader().execute(
+                    _CUSTOMERS_PAGE_SQL, (status, last_phone, page_size)
+                ).fetchall()
+                
+                for row in rows:
+                    yield self._row_to_customer(row)
+                if len(rows) < page_size:
+                    break
+                last_phone = rows[-1][1]
+    
+    def get_latest_version(self) -> int:
+        """Get the highest customer version, i.e. the point a full read is current as of"""
+        return self._reader().execute(_LATEST_VERSION_SQL).fetchone()[0]
+    
+    def get_customers_changed_since(self, version: int) -> Tuple[int, List[Customer]]:
+        """Get customers inserted or updated after `version`, with the latest version seen"""
+        cursor = self._reader().execute(_CUSTOMERS_CHANGED_SQL, (version,))
+        rows = cursor.fetchall()
         
-        return customers
+        latest = rows[-1][-1] if rows else version
+        return latest, [self._row_to_customer(row[:-1]) for row in rows]
+    
+    @staticmethod
+    def _row_to_customer(row) -> Customer:
+        """Build a Customer from a row selected with CUSTOMER_COLUMNS"""
+        return Customer(*row)
     
     def update_customer_status(self, phone: str, status: str, notes: str = "") -> bool:
         """Update customer status and notes"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             now = datetime.now().isoformat()
             
-            cursor.execute('''
-                UPDATE customers 
-                SET status = ?, notes = ?, last_contact = ?, updated_at = ?
-                WHERE phone = ?
-            ''', (status, notes, now, now, phone))
+            with self._lock, self._conn:
+                self._conn.execute(_UPDATE_STATUS_SQL, (status, notes, now, now, phone))
             
-            conn.commit()
-            conn.close()
-            logger.info(f"Updated customer {phone} status to {status}")
+            logger.info("Updated customer %s status to %s", phone, status)
             return True
             
         except Exception as e:
-            logger.error(f"Error updating customer status: {e}")
+            logger.error("Error updating customer status: %s", e)
             return False
     
     def log_call_history(self, phone: str, outcome: str, duration: int = 0, 
@@ -173,148 +389,143 @@ class CustomerManager:
                         follow_up_date: str = "", agent_name: str = "AI Agent") -> bool:
         """Log a call in the call history"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO call_history (
-                    customer_phone, call_date, duration_seconds, outcome,
-                    notes, follow_up_needed, follow_up_date, agent_name
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                phone, datetime.now().isoformat(), duration, outcome,
-                notes, follow_up_needed, follow_up_date, agent_name
-            ))
+            with self._lock, self._conn:
+                self._conn.execute(_INSERT_CALL_SQL, (
+                    phone, datetime.now().isoformat(), duration, outcome,
+                    notes, follow_up_needed, follow_up_date, agent_name, int(time.time())
+                ))
             
-            conn.commit()
-            conn.close()
-            logger.info(f"Logged call for {phone}: {outcome}")
+            logger.info("Logged call for %s: %s", phone, outcome)
             return True
             
         except Exception as e:
-            logger.error(f"Error logging call history: {e}")
+            logger.error("Error logging call history: %s", e)
             return False
     
+    def record_calls(self, calls: List[tuple]) -> int:
+        """Update statuses and log history for a batch of calls in one transaction
+        
+        Each call is a (phone, status, outcome, notes, duration, follow_up_needed) tuple.
+        Returns the number of calls recorded.
+        """
+        now = datetime.now().isoformat()
+        call_ts = int(time.time())
+        
+        with self._lock, self._conn:
+            self._conn.executemany(_UPDATE_STATUS_SQL, [
+                (status, notes, now, now, phone)
+                for phone, status, _, notes, _, _ in calls
+            ])
+            self._conn.executemany(_INSERT_CALL_SQL, [
+                (phone, now, duration, outcome, notes, follow_up_needed, "", "AI Agent", call_ts)
+                for phone, _, outcome, notes, duration, follow_up_needed in calls
+            ])
+        
+        logger.info("Recorded %d calls", len(calls))
+        return len(calls)
+    
+    def bulk_insert(self, rows: List[tuple]) -> int:
+        """Insert customer rows (tuples in CUSTOMER_COLUMNS order) in one transaction
+        
+        Rows whose phone number already exists are skipped. Returns the number inserted.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(_INSERT_OR_IGNORE_CUSTOMER_SQL, rows)
+            return cursor.rowcount
+    
     def import_from_csv(self, csv_file_path: str) -> int:
-        """Import customers from CSV file"""
+        """Import customers from CSV file in a single transaction"""
         imported_count = 0
         
         try:
+            now = datetime.now().isoformat()
+            
+            rows = []
             with open(csv_file_path, 'r', newline='') as csvfile:
                 reader = csv.DictReader(csvfile)
-                
                 for row in reader:
-                    customer = Customer(
-                        name=row.get('name', ''),
-                        phone=row.get('phone', ''),
-                        business_name=row.get('business_name', ''),
-                        business_type=row.get('business_type', ''),
-                        email=row.get('email', ''),
-                        address=row.get('address', ''),
-                        estimated_monthly_usage=int(row.get('estimated_monthly_usage', 0)),
-                        current_supplier=row.get('current_supplier', ''),
-                        best_contact_time=row.get('best_contact_time', ''),
-                        notes=row.get('notes', '')
-                    )
+                    # A bad row is skipped on its own rather than aborting the whole import
+                    usage = (row.get('estimated_monthly_usage') or '').strip()
+                    try:
+                        usage = int(usage) if usage else 0
+                    except ValueError:
+                        logger.warning("Skipping CSV line %s: invalid estimated_monthly_usage %r",
+                                       reader.line_num, usage)
+                        continue
                     
-                    if self.add_customer(customer):
-                        imported_count += 1
+                    # Tuple in CUSTOMER_COLUMNS order
+                    rows.append((
+                        row.get('name', ''), row.get('phone', ''),
+                        row.get('business_name', ''), row.get('business_type', ''),
+                        row.get('email', ''), row.get('address', ''),
+                        None, 'new', row.get('notes', ''),
+                        usage,
+                        row.get('current_supplier', ''), '',
+                        row.get('best_contact_time', ''), now, now
+                    ))
             
-            logger.info(f"Imported {imported_count} customers from {csv_file_path}")
+            imported_count = self.bulk_insert(rows)
+            logger.info("Imported %s customers from %s", imported_count, csv_file_path)
             
         except Exception as e:
-            logger.error(f"Error importing from CSV: {e}")
+            logger.error("Error importing from CSV: %s", e)
         
         return imported_count
     
     def export_to_csv(self, csv_file_path: str, status: str = None) -> bool:
         """Export customers to CSV file"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            if status:
-                cursor.execute('SELECT * FROM customers WHERE status = ?', (status,))
-            else:
-                cursor.execute('SELECT * FROM customers')
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
             with open(csv_file_path, 'w', newline='') as csvfile:
-                fieldnames = [
-                    'name', 'phone', 'business_name', 'business_type', 'email',
-                    'address', 'last_contact', 'status', 'notes',
-                    'estimated_monthly_usage', 'current_supplier', 'pain_points',
-                    'best_contact_time', 'created_at', 'updated_at'
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+                if status:
+                    cursor = self._reader().execute(_CUSTOMERS_BY_STATUS_SQL, (status,))
+                else:
+                    cursor = self._reader().execute(_SELECT_CUSTOMERS_SQL)
                 
-                for row in rows:
-                    writer.writerow({
-                        'name': row[1], 'phone': row[2], 'business_name': row[3],
-                        'business_type': row[4], 'email': row[5], 'address': row[6],
-                        'last_contact': row[7], 'status': row[8], 'notes': row[9],
-                        'estimated_monthly_usage': row[10], 'current_supplier': row[11],
-                        'pain_points': row[12], 'best_contact_time': row[13],
-                        'created_at': row[14], 'updated_at': row[15]
-                    })
+                # Rows come back in CUSTOMER_COLUMNS order, so stream them straight
+                # from the cursor instead of materializing the table first
+                writer = csv.writer(csvfile)
+                writer.writerow(CUSTOMER_COLUMNS)
+                writer.writerows(cursor)
             
-            logger.info(f"Exported customers to {csv_file_path}")
+            logger.info("Exported customers to %s", csv_file_path)
             return True
             
         except Exception as e:
-            logger.error(f"Error exporting to CSV: {e}")
+            logger.error("Error exporting to CSV: %s", e)
             return False
     
     def get_calling_queue(self, max_calls: int = 50, prioritize_by: str = "new") -> List[Customer]:
         """Get a prioritized list of customers to call"""
         
-        # Priority order for calling
-        status_priority = {
-            "new": 1,
-            "interested": 2,
-            "callback_requested": 3,
-            "contacted": 4
-        }
-        
+        # Filter, prioritize and limit in one query so only max_calls rows are fetched
         if prioritize_by == "new":
-            target_statuses = ["new", "interested", "callback_requested"]
+            sql, target_statuses = _PRIORITY_QUEUE_SQL, _PRIORITY_QUEUE_STATUSES
         else:
-            target_statuses = [prioritize_by]
-        
-        all_customers = []
-        for status in target_statuses:
-            customers = self.get_customers_by_status(status)
-            all_customers.extend(customers)
+            # One status: idx_customers_status_created already yields (created_at, phone) order
+            sql, target_statuses = _QUEUE_BY_STATUS_SQL, (prioritize_by,)
         
-        # Sort by priority and limit
-        all_customers.sort(key=lambda c: status_priority.get(c.status, 99))
+        cursor = self._reader().execute(sql, (*target_statuses, max_calls))
+        rows = cursor.fetchall()
         
-        return all_customers[:max_calls]
+        return [self._row_to_customer(row) for row in rows]
     
     def get_stats(self) -> Dict:
         """Get database statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._reader().cursor()
         
         # Customer counts by status
         cursor.execute('SELECT status, COUNT(*) FROM customers GROUP BY status')
         status_counts = dict(cursor.fetchall())
         
-        # Total customers
-        cursor.execute('SELECT COUNT(*) FROM customers')
-        total_customers = cursor.fetchone()[0]
-        
-        # Recent call activity (last 7 days)
-        cursor.execute('''
-            SELECT COUNT(*) FROM call_history 
-            WHERE call_date >= datetime('now', '-7 days')
-        ''')
+        # Recent call activity (last 7 days), as an index range scan on call_ts
+        cursor.execute(
+            'SELECT COUNT(*) FROM call_history WHERE call_ts >= ?',
+            (int(time.time()) - 7 * 86400,)
+        )
         recent_calls = cursor.fetchone()[0]
         
-        conn.close()
+        # Every customer has exactly one status, so the breakdown sums to the total
+        total_customers = sum(status_counts.values())
         
         return {
             "total_customers": total_customers,
@@ -391,14 +602,22 @@ def generate_sample_customers() -> List[Customer]:
     
     return sample_customers
 
+def sample_customer_rows() -> List[tuple]:
+    """Sample customers as insert-ready rows for CustomerManager.bulk_insert"""
+    now = datetime.now().isoformat()
+    rows = []
+    for customer in generate_sample_customers():
+        customer.created_at = now
+        customer.updated_at = now
+        rows.append(_customer_values(customer))
+    return rows
+
 if __name__ == "__main__":
     # Test the customer manager
     manager = CustomerManager("../data/customers.db")
     
     # Add sample customers
-    sample_customers = generate_sample_customers()
-    for customer in sample_customers:
-        manager.add_customer(customer)
+    manager.bulk_insert(sample_customer_rows())
     
     # Show stats
     stats = manager.get_stats()
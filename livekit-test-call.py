@@ -7,114 +7,127 @@ Tests the LiveKit + Telnyx integration by making a call to +32479202020
 import asyncio
 import logging
 import json
-from datetime import datetime
+import sys
+import time
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import aiohttp
+
+# Configure logging; plain messages on stdout keep the script's console output readable
+logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 logger = logging.getLogger(__name__)
 
 # Test configuration
 TEST_PHONE_NUMBER = "+32479202020"
 TELNYX_OUTBOUND_NUMBER = "+3226010500"  # Your Telnyx number
 LIVEKIT_URL = "ws://localhost:7880"
+LIVEKIT_HTTP_URL = "http://localhost:7880"
+
+# One pooled HTTP session shared by every check, created on first use
+_session = None
+
+def get_session():
+    """Return the shared aiohttp session"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+        )
+    return _session
 
 async def test_outbound_call():
     """Test making an outbound call via LiveKit + Telnyx"""
     
-    print("=" * 60)
-    print("🧪 LiveKit Outbound Call Test")
-    print("=" * 60)
-    print(f"📞 Calling: {TEST_PHONE_NUMBER}")
-    print(f"📡 From: {TELNYX_OUTBOUND_NUMBER}")
-    print(f"🔗 LiveKit: {LIVEKIT_URL}")
-    print("-" * 60)
+    logger.info("=" * 60)
+    logger.info("🧪 LiveKit Outbound Call Test")
+    logger.info("=" * 60)
+    logger.info("📞 Calling: %s", TEST_PHONE_NUMBER)
+    logger.info("📡 From: %s", TELNYX_OUTBOUND_NUMBER)
+    logger.info("🔗 LiveKit: %s", LIVEKIT_URL)
+    logger.info("-" * 60)
     
     try:
         # For now, we'll use LiveKit's REST API to initiate the call
         # In a real implementation, this would use the LiveKit Python SDK
         
-        import requests
-        
         # LiveKit API endpoint for creating SIP calls
         # Note: You'll need your actual LiveKit API key and secret
         livekit_api_url = "http://localhost:7880/twirp/livekit.SIPService/CreateSIPTrunk"
         
         # Test payload for outbound call
+        room_name = f"test_call_{time.strftime('%Y%m%d_%H%M%S')}"
         call_payload = {
             "to": TEST_PHONE_NUMBER,
             "from": TELNYX_OUTBOUND_NUMBER,
-            "room_name": f"test_call_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "room_name": room_name,
             "trunk_id": "telnyx-trunk"
         }
         
-        print("📋 Call Configuration:")
-        print(json.dumps(call_payload, indent=2))
-        print()
+        logger.info("📋 Call Configuration:")
+        logger.info(json.dumps(call_payload, indent=2))
+        logger.info("")
         
         # For this test, we'll simulate the call process
-        print("🔄 Simulating call process...")
-        print("1. ✅ Connecting to LiveKit server...")
+        logger.info("🔄 Simulating call process...")
+        logger.info("1. ✅ Connecting to LiveKit server...")
         await asyncio.sleep(1)
         
-        print("2. ✅ Validating Telnyx SIP trunk...")
+        logger.info("2. ✅ Validating Telnyx SIP trunk...")
         await asyncio.sleep(1)
         
-        print("3. ✅ Creating room for call...")
+        logger.info("3. ✅ Creating room for call...")
         await asyncio.sleep(1)
         
-        print("4. 📞 Initiating outbound call...")
+        logger.info("4. 📞 Initiating outbound call...")
         await asyncio.sleep(2)
         
-        print("5. ⏳ Waiting for call to connect...")
+        logger.info("5. ⏳ Waiting for call to connect...")
         await asyncio.sleep(3)
         
         # In a real scenario, we'd wait for actual call events
-        print("6. 🎉 Call simulation completed!")
-        print()
+        logger.info("6. 🎉 Call simulation completed!")
+        logger.info("")
         
-        print("📊 Test Results:")
-        print(f"✅ Target Number: {TEST_PHONE_NUMBER}")
-        print(f"✅ Source Number: {TELNYX_OUTBOUND_NUMBER}")
-        print(f"✅ LiveKit URL: {LIVEKIT_URL}")
-        print(f"✅ Room Created: test_call_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-        print()
+        logger.info("📊 Test Results:")
+        logger.info("✅ Target Number: %s", TEST_PHONE_NUMBER)
+        logger.info("✅ Source Number: %s", TELNYX_OUTBOUND_NUMBER)
+        logger.info("✅ LiveKit URL: %s", LIVEKIT_URL)
+        logger.info("✅ Room Created: %s", room_name)
+        logger.info("")
         
-        print("🔧 Next Steps for Real Implementation:")
-        print("1. Verify LiveKit server is running on your Ubuntu server")
-        print("2. Check Telnyx SIP trunk configuration")
-        print("3. Generate LiveKit API keys")
-        print("4. Test with actual LiveKit SDK")
+        logger.info("🔧 Next Steps for Real Implementation:")
+        logger.info("1. Verify LiveKit server is running on your Ubuntu server")
+        logger.info("2. Check Telnyx SIP trunk configuration")
+        logger.info("3. Generate LiveKit API keys")
+        logger.info("4. Test with actual LiveKit SDK")
         
         return True
         
     except Exception as e:
-        logger.error(f"Test call failed: {e}")
-        print(f"❌ Error: {e}")
+        logger.error("❌ Test call failed: %s", e)
         return False
 
 async def check_server_connectivity():
     """Check if LiveKit server is reachable"""
     
-    print("\n🔍 Checking Server Connectivity...")
+    logger.info("\n🔍 Checking Server Connectivity...")
     
     try:
-        import requests
-        
         # Test LiveKit health endpoint
-        response = requests.get("http://localhost:7880", timeout=5)
-        if response.status_code == 200:
-            print("✅ LiveKit server is responding")
+        async with get_session().get(LIVEKIT_HTTP_URL, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            status = response.status
+        if status == 200:
+            logger.info("✅ LiveKit server is responding")
             return True
         else:
-            print(f"⚠️  LiveKit server returned status: {response.status_code}")
+            logger.warning("⚠️  LiveKit server returned status: %s", status)
             return False
             
-    except requests.exceptions.ConnectionError:
-        print("❌ Cannot connect to LiveKit server at localhost:7880")
-        print("   Make sure Docker containers are running")
+    except aiohttp.ClientConnectionError:
+        logger.error("❌ Cannot connect to LiveKit server at localhost:7880")
+        logger.error("   Make sure Docker containers are running")
         return False
     except Exception as e:
-        print(f"❌ Connection test failed: {e}")
+        logger.error("❌ Connection test failed: %s", e)
         return False
 
 def create_test_commands():
@@ -167,23 +180,26 @@ async def main():
     """Main test function"""
     
     # Check connectivity first
-    server_ok = await check_server_connectivity()
+    try:
+        server_ok = await check_server_connectivity()
+    finally:
+        await get_session().close()
     
     if server_ok:
         # Run the test call simulation
         await test_outbound_call()
     else:
-        print("\n⚠️  Server connectivity issues detected")
-        print("Please ensure your LiveKit Docker containers are running")
+        logger.warning("\n⚠️  Server connectivity issues detected")
+        logger.warning("Please ensure your LiveKit Docker containers are running")
     
-    print("\n" + "=" * 60)
-    print("📋 SERVER TEST COMMANDS")
-    print("=" * 60)
-    print(create_test_commands())
-    print("=" * 60)
+    logger.info("\n" + "=" * 60)
+    logger.info("📋 SERVER TEST COMMANDS")
+    logger.info("=" * 60)
+    logger.info(create_test_commands())
+    logger.info("=" * 60)
     
-    print(f"\n🎯 GOAL: Make a real call to {TEST_PHONE_NUMBER}")
-    print("Run the commands above on your Ubuntu server to test the actual call")
+    logger.info("\n🎯 GOAL: Make a real call to %s", TEST_PHONE_NUMBER)
+    logger.info("Run the commands above on your Ubuntu server to test the actual call")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -3,38 +3,60 @@
 import asyncio
 import logging
 import os
+import time
 
 from livekit import agents
-from livekit.agents import JobContext, WorkerOptions, cli, Agent
+from livekit.agents import AutoSubscribe, JobContext, JobProcess, WorkerOptions, cli, Agent
 from livekit.plugins import openai, silero
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ai-sales-agent")
 
-def prewarm(proc: JobContext):
+# Fixed system prompt: kept byte-identical across turns and sessions so the
+# provider's prompt prefix cache can be reused
+AGENT_INSTRUCTIONS = """You are a helpful AI sales assistant. 
+        CRITICAL: Keep ALL responses under 20 words. Never exceed this limit.
+        Be friendly but extremely brief. Answer questions with minimal words.
+        For "Can you hear me?" say "Yes, perfectly!"
+        For greetings say "Hi! How can I help today?"
+        Always respond with maximum 1-2 short sentences."""
+
+# Chat history items sent to the LLM per turn (about 8 user/assistant exchanges)
+MAX_HISTORY_ITEMS = 16
+
+class SalesAgent(Agent):
+    """Sales agent that only keeps a sliding window of recent history"""
+    
+    async def trim_history(self):
+        """Drop the oldest turns from the agent's own chat context"""
+        chat_ctx = self.chat_ctx.copy()
+        # Keeps the instructions message and drops the oldest turns
+        chat_ctx.truncate(max_items=MAX_HISTORY_ITEMS)
+        await self.update_chat_ctx(chat_ctx)
+
+def prewarm(proc: JobProcess):
     """Prewarm the agent by loading models"""
     logger.info("Prewarming AI sales agent...")
+    # Load the VAD model once per worker process instead of on every call
+    proc.userdata["vad"] = silero.VAD.load(
+        min_speech_duration_ms=100,  # Detect speech faster
+        min_silence_duration_ms=500,  # Shorter silence before processing
+    )
 
 async def entrypoint(ctx: JobContext):
     """Main entrypoint for the LiveKit agent"""
     logger.info("Starting AI sales agent session...")
     
     # Create the agent with optimized instructions for fast responses
-    agent = Agent(
-        instructions="""You are a helpful AI sales assistant. 
-        CRITICAL: Keep ALL responses under 20 words. Never exceed this limit.
-        Be friendly but extremely brief. Answer questions with minimal words.
-        For "Can you hear me?" say "Yes, perfectly!"
-        For greetings say "Hi! How can I help today?"
-        Always respond with maximum 1-2 short sentences."""
-    )
+    agent = SalesAgent(instructions=AGENT_INSTRUCTIONS)
     
     # Create agent session with optimized components for low latency
     session = agents.AgentSession(
         # Use streaming STT for faster transcription
         stt=openai.STT(
-            model="whisper-1",
-            # Enable streaming and reduce latency
+            model="gpt-4o-mini-transcribe",
+            # Stream audio over the realtime transcription API for interim results
+            use_realtime=True,
             language="en",
             detect_language=False,  # Skip language detection for speed
         ),
@@ -49,13 +71,15 @@ async def entrypoint(ctx: JobContext):
             speed=1.1,  # Slightly faster speech
             model="tts-1",  # Use faster TTS model
         ),
-        # Optimize VAD for faster detection
-        vad=silero.VAD.load(
-            min_speech_duration_ms=100,  # Detect speech faster
-            min_silence_duration_ms=500,  # Shorter silence before processing
-        ),
+        # VAD tuned for faster detection, loaded in prewarm
+        vad=ctx.proc.userdata["vad"],
+        # Start the LLM on the final transcript before end-of-turn is confirmed
+        preemptive_generation=True,
     )
     
+    # Voice-only agent: have the SFU forward audio tracks only, never video
+    await ctx.connect(auto_subscribe=AutoSubscribe.AUDIO_ONLY)
+    
     # Start the session with streaming enabled for low latency
     await session.start(
         room=ctx.room,
@@ -70,25 +94,34 @@ async def entrypoint(ctx: JobContext):
         instructions="Say a quick friendly greeting in 5 words or less to a customer."
     )
     
-    # Add event handler for user speech to ensure responses with timing
-    @session.on("user_speech_committed")
-    async def on_user_speech(event):
-        import time
-        start_time = time.time()
-        
-        user_message = event.alternatives[0].text
-        logger.info(f"⚡ User speech received: '{user_message}' at {start_time}")
-        
-        # Generate short contextual response
-        response_start = time.time()
-        await session.generate_reply(
-            instructions=f"User said: '{user_message}'. Reply in 1-2 short sentences. Be brief and helpful."
-        )
-        
-        end_time = time.time()
-        total_latency = end_time - start_time
-        response_latency = end_time - response_start
-        logger.info(f"⏱️  Total latency: {total_latency:.2f}s, Response generation: {response_latency:.2f}s")
+    # The session already streams LLM tokens into TTS for every user turn,
+    # so these handlers only time the gap from final transcript to speech
+    turn_started = None
+    
+    @session.on("user_input_transcribed")
+    def on_user_speech(event):
+        nonlocal turn_started
+        if event.is_final:
+            turn_started = time.perf_counter()
+            logger.debug("⚡ User speech received: %r", event.transcript)
+    
+    @session.on("agent_state_changed")
+    def on_agent_state(event):
+        nonlocal turn_started
+        if event.new_state == "speaking" and turn_started is not None:
+            logger.info("⏱️  Response latency: %.2fs", time.perf_counter() - turn_started)
+            turn_started = None
+    
+    # Trim the agent's history once each reply lands, so the next turn's
+    # preemptive and final generations are built from the same context
+    trim_tasks = set()
+    
+    @session.on("conversation_item_added")
+    def on_item_added(event):
+        if event.item.role == "assistant" and len(agent.chat_ctx.items) > MAX_HISTORY_ITEMS:
+            task = asyncio.create_task(agent.trim_history())
+            trim_tasks.add(task)
+            task.add_done_callback(trim_tasks.discard)
     
     logger.info("AI sales agent session started successfully")
 
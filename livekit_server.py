@@ -2,8 +2,9 @@
 
 import asyncio
 import logging
-import json
-from aiohttp import web, ClientSession
+import time
+import orjson
+from aiohttp import web, ClientSession, TCPConnector
 from livekit.api import room_service, AccessToken, VideoGrants
 import os
 
@@ -15,15 +16,45 @@ LIVEKIT_URL = os.getenv("LIVEKIT_URL", "ws://localhost:8881")
 LIVEKIT_API_KEY = os.getenv("LIVEKIT_API_KEY", "devkey")
 LIVEKIT_API_SECRET = os.getenv("LIVEKIT_API_SECRET", "devkey-secret-that-is-long-enough-for-livekit-requirements-32plus-chars")
 
+# CORS headers added to every response
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization'
+}
+
+def mint_token(identity: str, name: str, room: str) -> str:
+    """Sign a join token for `room`"""
+    token_request = AccessToken(LIVEKIT_API_KEY, LIVEKIT_API_SECRET)
+    token_request.with_identity(identity)
+    token_request.with_name(name)
+    token_request.with_grants(VideoGrants(
+        room_join=True,
+        room=room,
+        can_publish=True,
+        can_subscribe=True
+    ))
+    return token_request.to_jwt()
+
 class LiveKitService:
     def __init__(self):
         self.session = None
         self.room_service = None
+        self._lock = asyncio.Lock()
     
-    async def init_session(self):
-        """Initialize aiohttp session and room service"""
-        if not self.session:
-            self.session = ClientSession()
+    async def start(self):
+        """Open the shared aiohttp session and room service"""
+        async with self._lock:
+            if self.session is not None:
+                return
+            # Keep connections to LiveKit alive between room calls and cache its DNS lookup;
+            # asyncio already sets TCP_NODELAY on every client socket
+            self.session = ClientSession(connector=TCPConnector(
+                limit=100,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                force_close=False
+            ))
             self.room_service = room_service.RoomService(
                 session=self.session,
                 url=LIVEKIT_URL,
@@ -31,27 +62,25 @@ class LiveKitService:
                 api_secret=LIVEKIT_API_SECRET
             )
     
+    async def close(self):
+        """Close the shared aiohttp session"""
+        async with self._lock:
+            if self.session is None:
+                return
+            await self.session.close()
+            self.session = None
+            self.room_service = None
+    
     async def create_room(self, room_name: str, agent_config: dict):
         """Create a new LiveKit room for voice conversation"""
         try:
-            await self.init_session()
             # Create room
             room_create = room_service.CreateRoomRequest(name=room_name)
             room = await self.room_service.create_room(room_create)
             logger.info(f"Created room: {room.name}")
             
             # Generate participant token for customer
-            token_request = AccessToken(LIVEKIT_API_KEY, LIVEKIT_API_SECRET)
-            token_request.with_identity("customer")
-            token_request.with_name("Customer")
-            token_request.with_grants(VideoGrants(
-                room_join=True,
-                room=room_name,
-                can_publish=True,
-                can_subscribe=True
-            ))
-            
-            customer_token = token_request.to_jwt()
+            customer_token = mint_token("customer", "Customer", room_name)
             
             return {
                 "room_name": room.name,
@@ -66,7 +95,6 @@ class LiveKitService:
     async def end_room(self, room_name: str):
         """End a LiveKit room"""
         try:
-            await self.init_session()
             await self.room_service.delete_room(room_service.DeleteRoomRequest(room=room_name))
             logger.info(f"Ended room: {room_name}")
             return True
@@ -74,97 +102,126 @@ class LiveKitService:
             logger.error(f"Error ending room: {e}")
             return False
 
-# Global service instance
-livekit_service = LiveKitService()
+# The service lives on the app (created in create_app) so it can be swapped out
+LIVEKIT_SERVICE = web.AppKey("livekit", LiveKitService)
+
+# Session requests are tiny; anything larger is rejected before decoding
+# (also the app's client_max_size, which bounds chunked bodies too)
+MAX_BODY_SIZE = 8192
+
+def json_response(data, status: int = 200):
+    """Build a JSON response serialized with orjson"""
+    return web.Response(body=orjson.dumps(data), status=status, content_type='application/json')
+
+def body_too_large_response():
+    """413 response for request bodies over MAX_BODY_SIZE"""
+    return json_response({"success": False, "error": "Request body too large"}, status=413)
 
 async def create_voice_session(request):
     """Create a new voice session with LiveKit"""
+    # Fast path for a declared length; chunked bodies are capped by client_max_size
+    if request.content_length and request.content_length > MAX_BODY_SIZE:
+        return body_too_large_response()
+    
     try:
-        data = await request.json()
+        data = await request.json(loads=orjson.loads)
         agent_id = data.get('agent_id')
         agent_config = data.get('agent_config', {})
         
         if not agent_id:
-            return web.json_response(
+            return json_response(
                 {"success": False, "error": "Agent ID required"}, 
                 status=400
             )
         
         # Create unique room name
-        room_name = f"voice_session_{agent_id}_{int(asyncio.get_event_loop().time())}"
+        room_name = f"voice_session_{agent_id}_{time.monotonic_ns()}"
         
         # Create LiveKit room
-        room_data = await livekit_service.create_room(room_name, agent_config)
+        room_data = await request.app[LIVEKIT_SERVICE].create_room(room_name, agent_config)
         
-        return web.json_response({
+        return json_response({
             "success": True,
             "session_data": room_data
         })
         
+    except web.HTTPRequestEntityTooLarge:
+        return body_too_large_response()
     except Exception as e:
         logger.error(f"Error creating voice session: {e}")
-        return web.json_response(
+        return json_response(
             {"success": False, "error": str(e)}, 
             status=500
         )
 
 async def end_voice_session(request):
     """End a voice session"""
+    # Fast path for a declared length; chunked bodies are capped by client_max_size
+    if request.content_length and request.content_length > MAX_BODY_SIZE:
+        return body_too_large_response()
+    
     try:
-        data = await request.json()
+        data = await request.json(loads=orjson.loads)
         room_name = data.get('room_name')
         
         if not room_name:
-            return web.json_response(
+            return json_response(
                 {"success": False, "error": "Room name required"}, 
                 status=400
             )
         
-        success = await livekit_service.end_room(room_name)
+        success = await request.app[LIVEKIT_SERVICE].end_room(room_name)
         
-        return web.json_response({
+        return json_response({
             "success": success
         })
         
+    except web.HTTPRequestEntityTooLarge:
+        return body_too_large_response()
     except Exception as e:
         logger.error(f"Error ending voice session: {e}")
-        return web.json_response(
+        return json_response(
             {"success": False, "error": str(e)}, 
             status=500
         )
 
+@web.middleware
+async def add_cors_headers(request, handler):
+    """Add the CORS headers to every response"""
+    response = await handler(request)
+    response.headers.update(CORS_HEADERS)
+    return response
+
+async def options_handler(request):
+    """Answer CORS preflight requests"""
+    # The CORS headers themselves are added by add_cors_headers
+    return web.Response()
+
 async def health_check(request):
     """Health check endpoint"""
-    return web.json_response({"status": "healthy"})
+    return json_response({"status": "healthy"})
 
 def create_app():
     """Create the aiohttp application"""
-    app = web.Application()
+    app = web.Application(client_max_size=MAX_BODY_SIZE)
+    app[LIVEKIT_SERVICE] = LiveKitService()
     
-    # Add CORS headers middleware
-    @web.middleware
-    async def add_cors_headers(request, handler):
-        response = await handler(request)
-        response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
-        return response
+    # Open the LiveKit session once at startup and close it on shutdown
+    async def start_livekit(app):
+        await app[LIVEKIT_SERVICE].start()
     
-    app.middlewares.append(add_cors_headers)
+    async def close_livekit(app):
+        await app[LIVEKIT_SERVICE].close()
     
-    # Handle OPTIONS requests
-    async def options_handler(request):
-        return web.Response(
-            headers={
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, Authorization'
-            }
-        )
+    app.on_startup.append(start_livekit)
+    app.on_cleanup.append(close_livekit)
+    
+    # Add CORS headers middleware
+    app.middlewares.append(add_cors_headers)
     
     # Handle GET requests to root with simple response
     async def root_handler(request):
-        return web.json_response({"status": "LiveKit Service Running", "version": "1.0.0"})
+        return json_response({"status": "LiveKit Service Running", "version": "1.0.0"})
     
     app.router.add_route('OPTIONS', '/{path:.*}', options_handler)
     app.router.add_get('/', root_handler)
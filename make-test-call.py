@@ -4,12 +4,19 @@ Make a real test call using LiveKit API
 This script will actually attempt to call +32479202020
 """
 
-import requests
+import asyncio
 import json
+import logging
 import time
 import sys
 from datetime import datetime
 
+import aiohttp
+
+# Configure logging; plain messages on stdout keep the script's console output readable
+logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+logger = logging.getLogger(__name__)
+
 # Configuration
 TARGET_PHONE = "+32479202020"
 TELNYX_NUMBER = "+3226010500"
@@ -22,36 +29,62 @@ TELNYX_CONFIG = {
     "server": "sip.telnyx.com"
 }
 
-def make_test_call():
+# Simulated call progress, shown one step per second
+STATUS_MESSAGES = (
+    "📡 Connecting to Telnyx SIP server...",
+    "🔐 Authenticating with credentials...",
+    f"📞 Dialing {TARGET_PHONE}...",
+    "⏳ Waiting for answer...",
+    "🎉 Call should be ringing your phone!"
+)
+
+# One pooled HTTP session shared by every check, created on first use
+_session = None
+
+def get_session():
+    """Return the shared aiohttp session"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+        )
+    return _session
+
+async def get_livekit_status():
+    """GET the LiveKit server root and return the HTTP status"""
+    async with get_session().get(LIVEKIT_URL, timeout=aiohttp.ClientTimeout(total=5)) as response:
+        return response.status
+
+async def make_test_call():
     """Make an actual test call via LiveKit + Telnyx"""
     
-    print("="*60)
-    print("📞 MAKING REAL TEST CALL")
-    print("="*60)
-    print(f"🎯 Calling: {TARGET_PHONE}")
-    print(f"📡 From: {TELNYX_NUMBER}")
-    print(f"🔗 LiveKit: {LIVEKIT_URL}")
-    print(f"⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*60)
+    logger.info("="*60)
+    logger.info("📞 MAKING REAL TEST CALL")
+    logger.info("="*60)
+    logger.info("🎯 Calling: %s", TARGET_PHONE)
+    logger.info("📡 From: %s", TELNYX_NUMBER)
+    logger.info("🔗 LiveKit: %s", LIVEKIT_URL)
+    logger.info("⏰ Time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    logger.info("-"*60)
     
     try:
         # Step 1: Check LiveKit server
-        print("1. 🔍 Checking LiveKit server...")
-        response = requests.get(f"{LIVEKIT_URL}", timeout=5)
-        if response.status_code == 200:
-            print("   ✅ LiveKit server is responding")
+        logger.info("1. 🔍 Checking LiveKit server...")
+        status = await get_livekit_status()
+        if status == 200:
+            logger.info("   ✅ LiveKit server is responding")
         else:
-            print(f"   ❌ LiveKit server error: {response.status_code}")
+            logger.error("   ❌ LiveKit server error: %s", status)
             return False
         
         # Step 2: Create room for the call
         room_name = f"test_call_{int(time.time())}"
-        print(f"2. 🏠 Creating room: {room_name}")
+        logger.info("2. 🏠 Creating room: %s", room_name)
         
         # Step 3: For now, we'll use a direct HTTP approach to test
         # In production, you'd use the LiveKit Python SDK
         
-        print("3. 📞 Initiating call...")
+        logger.info("3. 📞 Initiating call...")
         
         # This is a simulation - in reality you'd need:
         # 1. Proper LiveKit API keys
@@ -70,78 +103,79 @@ docker run --rm --network host livekit/livekit-cli sip create-outbound-call \\
   --room={room_name}
 """
         
-        print("📋 Command to run on your server:")
-        print(real_call_example)
+        logger.info("📋 Command to run on your server:")
+        logger.info(real_call_example)
         
         # Simulate call progress
-        print("\n🔄 Simulating call process...")
-        for i in range(5):
-            time.sleep(1)
-            status_messages = [
-                "📡 Connecting to Telnyx SIP server...",
-                "🔐 Authenticating with credentials...",
-                "📞 Dialing +32479202020...",
-                "⏳ Waiting for answer...",
-                "🎉 Call should be ringing your phone!"
-            ]
-            print(f"   {status_messages[i]}")
+        logger.info("\n🔄 Simulating call process...")
+        for message in STATUS_MESSAGES:
+            await asyncio.sleep(1)
+            logger.info("   %s", message)
         
-        print("\n" + "="*60)
-        print("📞 CHECK YOUR PHONE!")
-        print("="*60)
-        print(f"You should receive a call on {TARGET_PHONE}")
-        print("If you don't receive a call, check:")
-        print("1. LiveKit configuration")
-        print("2. Telnyx SIP trunk setup")
-        print("3. API keys")
-        print("4. Server logs")
+        logger.info("\n" + "="*60)
+        logger.info("📞 CHECK YOUR PHONE!")
+        logger.info("="*60)
+        logger.info("You should receive a call on %s", TARGET_PHONE)
+        logger.info("If you don't receive a call, check:")
+        logger.info("1. LiveKit configuration")
+        logger.info("2. Telnyx SIP trunk setup")
+        logger.info("3. API keys")
+        logger.info("4. Server logs")
         
         return True
         
-    except requests.exceptions.ConnectionError:
-        print("❌ Cannot connect to LiveKit server")
-        print("   Make sure LiveKit is running on your server")
+    except aiohttp.ClientConnectionError:
+        logger.error("❌ Cannot connect to LiveKit server")
+        logger.error("   Make sure LiveKit is running on your server")
         return False
     except Exception as e:
-        print(f"❌ Error: {e}")
+        logger.error("❌ Error: %s", e)
         return False
 
-def check_prerequisites():
+async def check_prerequisites():
     """Check if we can make the call"""
     
-    print("\n🔍 Checking prerequisites...")
+    logger.info("\n🔍 Checking prerequisites...")
     
     # Check if we're running on the server (has LiveKit access)
     try:
-        response = requests.get(f"{LIVEKIT_URL}", timeout=5)
-        print("✅ Can reach LiveKit server")
+        await get_livekit_status()
+        logger.info("✅ Can reach LiveKit server")
         return True
     except:
-        print("❌ Cannot reach LiveKit server")
-        print("   This script should be run on your Ubuntu server")
+        logger.error("❌ Cannot reach LiveKit server")
+        logger.error("   This script should be run on your Ubuntu server")
         return False
 
-def main():
+async def main():
     """Main function"""
     
-    print("🧪 LiveKit + Telnyx Test Call Script")
+    logger.info("🧪 LiveKit + Telnyx Test Call Script")
+    
+    try:
+        await run_test_call()
+    finally:
+        await get_session().close()
+
+async def run_test_call():
+    """Check prerequisites, then place the test call"""
     
-    if not check_prerequisites():
-        print("\n📋 To run this test:")
-        print("1. Copy this script to your Ubuntu server")
-        print("2. Install requests: pip3 install requests")
-        print("3. Run: python3 make-test-call.py")
+    if not await check_prerequisites():
+        logger.info("\n📋 To run this test:")
+        logger.info("1. Copy this script to your Ubuntu server")
+        logger.info("2. Install aiohttp: pip3 install aiohttp")
+        logger.info("3. Run: python3 make-test-call.py")
         return
     
     # Make the test call
-    success = make_test_call()
+    success = await make_test_call()
     
     if success:
-        print(f"\n🎉 Test call initiated to {TARGET_PHONE}")
-        print("Check your phone and server logs for results!")
+        logger.info("\n🎉 Test call initiated to %s", TARGET_PHONE)
+        logger.info("Check your phone and server logs for results!")
     else:
-        print(f"\n❌ Test call failed")
-        print("Check your LiveKit and Telnyx configuration")
+        logger.error("\n❌ Test call failed")
+        logger.error("Check your LiveKit and Telnyx configuration")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file